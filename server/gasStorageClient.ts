@@ -5,7 +5,7 @@
  * via a subprocess bridge script.
  */
 
-import { spawn } from 'child_process';
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
 import * as fs from 'fs';
 import * as path from 'path';
 import * as os from 'os';
@@ -87,6 +87,247 @@ export const DEFAULT_OPTIMIZATION_PARAMS: GasStorageOptimizationParams = {
   trading_days_per_year: 252,
 };
 
+// Maximum number of stderr characters kept for error messages
+const MAX_STDERR_LENGTH = 10000;
+
+// Number of bridge processes optimizations are spread across
+const BRIDGE_POOL_SIZE = 2;
+
+// Maximum number of requests in flight or queued on a single bridge process
+const MAX_PENDING_PER_WORKER = 4;
+
+// Time the bridge may work on one request before it is killed
+const BRIDGE_REQUEST_TIMEOUT_MS = 60 * 1000;
+
+interface PendingRequest {
+  input: object;
+  resolve: (result: GasStorageResult) => void;
+  reject: (error: Error) => void;
+  timer: ReturnType<typeof setTimeout> | null;
+}
+
+/**
+ * Long-lived Python bridge process
+ *
+ * The bridge reads newline-delimited JSON requests and answers each with one
+ * JSON line, so a single process amortizes Python/pandas startup across calls.
+ * Requests are tagged with an id and responses are matched back by that id.
+ * The process is spawned lazily and respawned on the next request if it exits.
+ *
+ * The bridge answers requests one at a time in the order they were sent, so
+ * only the request at the front of the queue is being worked on. Its timer is
+ * armed when it reaches the front; if it gets no response within
+ * BRIDGE_REQUEST_TIMEOUT_MS the process is killed, that request is rejected,
+ * and the requests queued behind it are re-sent to a fresh process.
+ */
+class GasStorageBridgeWorker {
+  private python: ChildProcessWithoutNullStreams | null = null;
+  private pending: Map<number, PendingRequest> = new Map();
+  private nextId = 1;
+  private stdoutBuffer = '';
+  private stderr = '';
+
+  /**
+   * Number of requests in flight or queued on this process
+   */
+  get load(): number {
+    return this.pending.size;
+  }
+
+  /**
+   * Send a request to the bridge and wait for its response
+   */
+  request(input: object): Promise<GasStorageResult> {
+    return new Promise<GasStorageResult>((resolve, reject) => {
+      this.enqueue({ input, resolve, reject, timer: null });
+    });
+  }
+
+  /**
+   * Write a request to the bridge process and add it to the queue
+   */
+  private enqueue(request: PendingRequest): void {
+    const python = this.ensureProcess();
+    const id = this.nextId++;
+
+    this.pending.set(id, request);
+    python.stdin.write(JSON.stringify({ ...request.input, id }) + '\n');
+    this.armFrontTimer();
+  }
+
+  /**
+   * Start the timeout of the request the bridge is currently working on
+   */
+  private armFrontTimer(): void {
+    const python = this.python;
+    const front = this.pending.entries().next();
+    if (!python || front.done) {
+      return;
+    }
+
+    const [id, request] = front.value;
+    if (request.timer === null) {
+      request.timer = setTimeout(() => this.handleTimeout(python, id), BRIDGE_REQUEST_TIMEOUT_MS);
+    }
+  }
+
+  /**
+   * Kill a bridge stuck on one request and re-send the requests queued behind it
+   */
+  private handleTimeout(python: ChildProcessWithoutNullStreams, id: number): void {
+    if (this.python !== python) {
+      return;
+    }
+
+    const timedOut = this.pending.get(id);
+    this.pending.delete(id);
+    const queued = Array.from(this.pending.values());
+    this.pending.clear();
+
+    this.python = null;
+    python.kill();
+
+    timedOut?.reject(
+      new Error(`Gas storage optimization timed out after ${BRIDGE_REQUEST_TIMEOUT_MS} ms`)
+    );
+    for (const request of queued) {
+      this.enqueue(request);
+    }
+  }
+
+  /**
+   * Get the running bridge process, spawning it if needed
+   */
+  private ensureProcess(): ChildProcessWithoutNullStreams {
+    if (this.python) {
+      return this.python;
+    }
+
+    // Get the path to the bridge script
+    const bridgeScript = path.join(__dirname, 'gas_storage_bridge.py');
+
+    const python = spawn('python3', [bridgeScript], {
+      stdio: ['pipe', 'pipe', 'pipe'],
+    });
+    this.python = python;
+    this.stdoutBuffer = '';
+    this.stderr = '';
+
+    python.stdout.setEncoding('utf-8');
+    python.stdout.on('data', (data: string) => {
+      this.stdoutBuffer += data;
+
+      let newlineIndex: number;
+      while ((newlineIndex = this.stdoutBuffer.indexOf('\n')) !== -1) {
+        const line = this.stdoutBuffer.slice(0, newlineIndex).trim();
+        this.stdoutBuffer = this.stdoutBuffer.slice(newlineIndex + 1);
+        if (line) {
+          this.handleResponse(line);
+        }
+      }
+    });
+
+    python.stderr.on('data', (data) => {
+      this.stderr = (this.stderr + data.toString()).slice(-MAX_STDERR_LENGTH);
+    });
+
+    python.on('close', (code) => {
+      this.handleExit(python, new Error(`Python process exited with code ${code}: ${this.stderr}`));
+    });
+
+    python.on('error', (error) => {
+      this.handleExit(python, new Error(`Failed to spawn Python process: ${error.message}`));
+    });
+
+    python.stdin.on('error', (error) => {
+      this.handleExit(python, new Error(`Failed to write to Python process: ${error.message}`));
+    });
+
+    return python;
+  }
+
+  /**
+   * Resolve the pending request matching a response line
+   */
+  private handleResponse(line: string): void {
+    let response: GasStorageResult & { id?: number };
+    try {
+      response = JSON.parse(line);
+    } catch (parseError) {
+      console.warn(`Failed to parse Python output: ${line}\nStderr: ${this.stderr}`);
+      return;
+    }
+
+    const { id, ...result } = response;
+    const pending = id !== undefined ? this.pending.get(id) : undefined;
+    if (id === undefined || !pending) {
+      console.warn(`Unexpected Python output: ${line}`);
+      return;
+    }
+
+    if (pending.timer !== null) {
+      clearTimeout(pending.timer);
+    }
+    this.pending.delete(id);
+    pending.resolve(result);
+    this.armFrontTimer();
+  }
+
+  /**
+   * Reject all in-flight requests when the bridge process goes away
+   */
+  private handleExit(python: ChildProcessWithoutNullStreams, error: Error): void {
+    if (this.python !== python) {
+      return;
+    }
+
+    this.python = null;
+    python.kill();
+
+    const pending = Array.from(this.pending.values());
+    this.pending.clear();
+    for (const request of pending) {
+      if (request.timer !== null) {
+        clearTimeout(request.timer);
+      }
+      request.reject(error);
+    }
+  }
+}
+
+/**
+ * Small pool of bridge processes
+ *
+ * Each request goes to the least loaded process, so one slow optimization
+ * does not serialize all others. Requests are rejected up front once every
+ * process already has MAX_PENDING_PER_WORKER requests outstanding.
+ */
+class GasStorageBridgePool {
+  private workers: GasStorageBridgeWorker[] = Array.from(
+    { length: BRIDGE_POOL_SIZE },
+    () => new GasStorageBridgeWorker()
+  );
+
+  /**
+   * Send a request to the least loaded bridge process
+   */
+  request(input: object): Promise<GasStorageResult> {
+    const worker = this.workers.reduce((least, candidate) =>
+      candidate.load < least.load ? candidate : least
+    );
+
+    if (worker.load >= MAX_PENDING_PER_WORKER) {
+      return Promise.reject(
+        new Error('Gas storage bridge is busy: too many optimizations queued')
+      );
+    }
+
+    return worker.request(input);
+  }
+}
+
+const bridgePool = new GasStorageBridgePool();
+
 /**
  * Write forward curve data to a temporary CSV file
  */
@@ -163,48 +404,8 @@ export async function runGasStorageOptimization(
       optimization_params: optimization,
     };
 
-    // Get the path to the bridge script
-    const bridgeScript = path.join(__dirname, 'gas_storage_bridge.py');
-
     // Run Python bridge
-    const result = await new Promise<GasStorageResult>((resolve, reject) => {
-      const python = spawn('python3', [bridgeScript], {
-        stdio: ['pipe', 'pipe', 'pipe'],
-      });
-
-      let stdout = '';
-      let stderr = '';
-
-      python.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0 && !stdout) {
-          reject(new Error(`Python process exited with code ${code}: ${stderr}`));
-          return;
-        }
-
-        try {
-          const result = JSON.parse(stdout);
-          resolve(result);
-        } catch (parseError) {
-          reject(new Error(`Failed to parse Python output: ${stdout}\nStderr: ${stderr}`));
-        }
-      });
-
-      python.on('error', (error) => {
-        reject(new Error(`Failed to spawn Python process: ${error.message}`));
-      });
-
-      // Send input to Python
-      python.stdin.write(JSON.stringify(input));
-      python.stdin.end();
-    });
+    const result = await bridgePool.request(input);
 
     return result;
 
@@ -1,46 +1,108 @@
 #!/usr/bin/env python3
 """Bridge script to call gas_storage package and output JSON results.
 
-This script is called by the Node.js backend to run gas storage optimization
-and return results in JSON format.
+This script is run by the Node.js backend as a long-lived worker: it reads
+newline-delimited JSON optimization requests from stdin and writes one JSON
+result line per request to stdout.
 """
 
-import json
+import hashlib
 import sys
+from collections import OrderedDict
 from datetime import date
 from pathlib import Path
 
-import pandas as pd
+import orjson
 
-from gas_storage import (
-    load_forward_curve,
-    optimize_storage,
-    FacilityParams,
-    OptimizationParams,
-)
+# pandas, numpy and gas_storage are imported inside the functions that need
+# them, so malformed requests are answered without paying their import cost
 
+# Number of parsed forward curves kept in memory across requests
+FORWARD_CURVE_CACHE_SIZE = 8
 
-def main():
-    """Main entry point for the bridge script."""
-    # Read input from stdin
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
-        print(json.dumps({"success": False, "error": f"Invalid JSON input: {e}"}))
-        sys.exit(1)
+_forward_curve_cache = OrderedDict()
+
+
+def load_forward_curve_cached(path):
+    """Load a forward curve, reusing the parsed result for identical files.
+
+    The Node.js client writes each request's curve to a new temp file, so the
+    cache is keyed by file content rather than path/mtime. A copy is returned
+    so the optimizer can never mutate the cached curve.
+    """
+    from gas_storage import load_forward_curve
+
+    key = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+    forward = _forward_curve_cache.get(key)
+    if forward is None:
+        forward = load_forward_curve(path)
+        _forward_curve_cache[key] = forward
+        if len(_forward_curve_cache) > FORWARD_CURVE_CACHE_SIZE:
+            _forward_curve_cache.popitem(last=False)
+    else:
+        _forward_curve_cache.move_to_end(key)
+
+    return forward.copy()
+
+
+def write_json(payload):
+    """Serialize payload with orjson and write it to stdout."""
+    sys.stdout.buffer.write(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    )
+    sys.stdout.flush()
+
+
+def trade_columns(trades_df):
+    """Extract the optimizer's trades as output-named numpy column arrays."""
+    import numpy as np
+    import pandas as pd
+
+    return {
+        "inject_period": trades_df["Inject_Period"].to_numpy(dtype=np.int64),
+        "withdraw_period": trades_df["Withdraw_Period"].to_numpy(dtype=np.int64),
+        "inject_date": pd.to_datetime(trades_df["Inject_Date"]).dt.strftime("%Y-%m-%d").to_numpy(),
+        "withdraw_date": pd.to_datetime(trades_df["Withdraw_Date"]).dt.strftime("%Y-%m-%d").to_numpy(),
+        "volume": trades_df["Volume"].to_numpy(dtype=np.float64),
+        "spread": trades_df["Spread"].to_numpy(dtype=np.float64),
+        "profit": trades_df["Profit"].to_numpy(dtype=np.float64),
+    }
 
+
+def schedule_records(schedule, value_key, min_value=None):
+    """Convert a date-indexed mapping into a list of {"date", value_key} records.
+
+    If min_value is given, entries at or below it are dropped.
+    """
+    import pandas as pd
+
+    series = pd.Series(schedule, dtype=float)
+    if min_value is not None:
+        series = series[series > min_value]
+
+    dates = pd.to_datetime(series.index).strftime("%Y-%m-%d")
+    return [
+        {"date": expiry_date, value_key: value}
+        for expiry_date, value in zip(dates, series.tolist())
+    ]
+
+
+def handle_request(input_data):
+    """Run one optimization request and return the JSON-serializable response."""
     # Extract parameters
     forward_curve_path = input_data.get("forward_curve_path")
     facility_params = input_data.get("facility_params", {})
     optimization_params = input_data.get("optimization_params", {})
 
     if not forward_curve_path:
-        print(json.dumps({"success": False, "error": "forward_curve_path is required"}))
-        sys.exit(1)
+        return {"success": False, "error": "forward_curve_path is required"}
 
     try:
+        from gas_storage import FacilityParams, OptimizationParams, optimize_storage
+
         # Load forward curve
-        forward = load_forward_curve(forward_curve_path)
+        forward = load_forward_curve_cached(forward_curve_path)
 
         # Create facility parameters
         facility = FacilityParams(
@@ -73,48 +135,24 @@ def main():
         # Build output
         trades = []
         if not result.trades_df.empty:
-            for _, row in result.trades_df.iterrows():
-                trades.append({
-                    "inject_period": int(row["Inject_Period"]),
-                    "withdraw_period": int(row["Withdraw_Period"]),
-                    "inject_date": row["Inject_Date"].strftime("%Y-%m-%d"),
-                    "withdraw_date": row["Withdraw_Date"].strftime("%Y-%m-%d"),
-                    "volume": float(row["Volume"]),
-                    "spread": float(row["Spread"]),
-                    "profit": float(row["Profit"]),
-                })
-
-        # Build storage positions output
-        storage_positions = []
-        for expiry_date, position in positions.items():
-            storage_positions.append({
-                "date": expiry_date.strftime("%Y-%m-%d"),
-                "position": float(position),
-            })
-
-        # Get injection and withdrawal schedules
-        injections = result.get_injection_schedule()
-        withdrawals = result.get_withdrawal_schedule()
-
-        injection_schedule = []
-        for expiry_date, volume in injections.items():
-            if volume > 1e-6:
-                injection_schedule.append({
-                    "date": expiry_date.strftime("%Y-%m-%d"),
-                    "volume": float(volume),
-                })
-
-        withdrawal_schedule = []
-        for expiry_date, volume in withdrawals.items():
-            if volume > 1e-6:
-                withdrawal_schedule.append({
-                    "date": expiry_date.strftime("%Y-%m-%d"),
-                    "volume": float(volume),
-                })
+            columns = trade_columns(result.trades_df)
+            trades = [
+                dict(zip(columns, row))
+                for row in zip(*(values.tolist() for values in columns.values()))
+            ]
+
+        # Build storage positions and injection/withdrawal schedules output
+        storage_positions = schedule_records(positions, "position")
+        injection_schedule = schedule_records(
+            result.get_injection_schedule(), "volume", min_value=1e-6
+        )
+        withdrawal_schedule = schedule_records(
+            result.get_withdrawal_schedule(), "volume", min_value=1e-6
+        )
 
         output = {
             "success": result.success,
-            "total_pnl": float(result.total_pnl),
+            "total_pnl": result.total_pnl,
             "num_trades": result.num_trades,
             "trades": trades,
             "storage_positions": storage_positions,
@@ -130,17 +168,48 @@ def main():
             },
         }
 
-        print(json.dumps(output))
+        return output
 
     except FileNotFoundError as e:
-        print(json.dumps({"success": False, "error": f"File not found: {e}"}))
-        sys.exit(1)
+        return {"success": False, "error": f"File not found: {e}"}
     except ValueError as e:
-        print(json.dumps({"success": False, "error": f"Invalid value: {e}"}))
-        sys.exit(1)
+        return {"success": False, "error": f"Invalid value: {e}"}
     except Exception as e:
-        print(json.dumps({"success": False, "error": f"Optimization failed: {e}"}))
-        sys.exit(1)
+        return {"success": False, "error": f"Optimization failed: {e}"}
+
+
+def main():
+    """Main entry point for the bridge script.
+
+    Reads newline-delimited JSON requests from stdin and writes one JSON
+    response line per request, so a single long-running process can serve
+    many optimizations. A request's "id" field is echoed back in its response.
+    """
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+
+        try:
+            input_data = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            write_json({"success": False, "error": f"Invalid JSON input: {e}"})
+            continue
+
+        if not isinstance(input_data, dict):
+            write_json({"success": False, "error": "Invalid JSON input: expected an object"})
+            continue
+
+        response = handle_request(input_data)
+        if "id" in input_data:
+            response["id"] = input_data["id"]
+
+        try:
+            write_json(response)
+        except orjson.JSONEncodeError as e:
+            error_response = {"success": False, "error": f"Failed to serialize result: {e}"}
+            if "id" in input_data:
+                error_response["id"] = input_data["id"]
+            write_json(error_response)
 
 
 if __name__ == "__main__":
@@ -6,30 +6,142 @@ This module provides functionality to fetch historical and live forward curves
 for Natural Gas (Henry Hub) futures from free public sources.
 
 Data Sources:
-- Yahoo Finance (via yfinance library): Primary source for futures data
-  - Continuous contract: NG=F
+- Yahoo Finance v8 chart API (via aiohttp): Primary source for live quotes
   - Individual contracts: NGH26.NYM, NGM26.NYM, etc.
+  - Contracts the async fetch misses are retried one at a time via requests
+- Yahoo Finance (via yfinance library): Historical data
+  - Continuous contract: NG=F
 
 Author: Manus AI
 Date: January 2026
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import os
 import json
+import random
+import tempfile
 import time
 
 warnings.filterwarnings('ignore')
 
+if TYPE_CHECKING:
+    import aiohttp
+
+# yfinance, matplotlib and aiohttp are imported inside the methods that use
+# them so fetching one kind of data doesn't pay the import cost of the others
+
+# Yahoo Finance chart endpoint (returns OHLCV arrays as JSON, no pandas needed)
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_CHART_FALLBACK_URL = "https://query2.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+# Fields of a cached OHLCV bar. Last_Update is stored as an ISO string and
+# Timezone holds its zone name, since the ISO offset alone loses the zone.
+CACHED_BAR_FIELDS = ('Close', 'Volume', 'Open', 'High', 'Low', 'Last_Update', 'Timezone')
+
+# Yahoo rejects requests without a browser-like User-Agent
+YAHOO_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# Shared HTTP session so synchronous requests reuse pooled TLS connections
+# instead of paying a fresh handshake per contract. It only serves the fallback
+# after the async path has already retried, so it makes a single attempt.
+_SESSION = requests.Session()
+_SESSION.headers.update(YAHOO_HEADERS)
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+
+def _header_number(headers, name: str) -> Optional[float]:
+    """Parse a numeric header value, ignoring missing or malformed values."""
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class AsyncRateLimiter:
+    """
+    Concurrency limiter for asyncio requests that self-throttles from
+    rate-limit response headers.
+    
+    The number of requests in flight is capped at the smaller of
+    max_concurrency and the latest X-RateLimit-Limit header. When a response
+    carries Retry-After, no new request starts until that delay (capped at
+    max_wait seconds) has passed; when X-RateLimit-Remaining reaches zero, requests are serialized until
+    the server reports remaining capacity again.
+    
+    Example Usage:
+        >>> limiter = AsyncRateLimiter(max_concurrency=16)
+        >>> async with limiter:
+        ...     async with session.get(url) as response:
+        ...         limiter.update(response.headers)
+    """
+    
+    def __init__(self, max_concurrency: int = 16, max_wait: float = 30.0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_concurrency: Upper bound on concurrent requests
+            max_wait: Longest Retry-After pause in seconds to honor
+        """
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self.limit = max_concurrency
+        self._ceiling = max_concurrency
+        self._active = 0
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+    
+    async def acquire(self) -> None:
+        """Wait for a free request slot and any server-requested pause."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    async def release(self) -> None:
+        """Return a request slot."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+    
+    def update(self, headers) -> None:
+        """
+        Adjust the limit and pause from a response's rate-limit headers.
+        
+        Args:
+            headers: Response headers mapping
+        """
+        limit = _header_number(headers, 'X-RateLimit-Limit')
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        retry_after = _header_number(headers, 'Retry-After')
+        
+        if limit is not None:
+            self._ceiling = max(1, min(self.max_concurrency, int(limit)))
+        self.limit = 1 if remaining is not None and remaining <= 0 else self._ceiling
+        
+        if retry_after is not None:
+            delay = min(max(0.0, retry_after), self.max_wait)
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+    
+    async def __aenter__(self) -> 'AsyncRateLimiter':
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
+
 
 class NaturalGasForwardCurve:
     """
@@ -58,11 +170,44 @@ class NaturalGasForwardCurve:
         7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'
     }
     
-    def __init__(self):
-        """Initialize the NaturalGasForwardCurve instance."""
+    # Maximum number of concurrent connections to the Yahoo Finance chart API
+    max_connections_per_host = 16
+    
+    # Attempts per contract when Yahoo responds with 429 or 5xx
+    max_retries = 3
+    
+    # Total timeout in seconds for a single chart request
+    request_timeout = 10
+    
+    # Longest Retry-After in seconds to wait out before giving up on a contract
+    max_retry_wait = 30
+    
+    # Maximum number of concurrent single-contract requests to Yahoo Finance
+    max_workers = 16
+    
+    def __init__(self, cache_ttl: float = 60.0, cache_path: Optional[str] = None):
+        """
+        Initialize the NaturalGasForwardCurve instance.
+        
+        Args:
+            cache_ttl: Seconds a fetched contract quote stays valid in the
+                on-disk quote cache (0 disables caching)
+            cache_path: Path of the quote cache file (defaults to
+                ng_forward_curve/quotes.json in the user's cache directory)
+        """
         self.continuous_symbol = "NG=F"  # Yahoo Finance continuous contract symbol
         self.base_symbol = "NG"  # Base symbol for natural gas futures
-        
+        self.cache_ttl = cache_ttl
+        self.cache_path = cache_path or os.path.join(
+            os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+            'ng_forward_curve', 'quotes.json')
+        
+    @staticmethod
+    def _add_months(year: int, month: int, offset: int) -> Tuple[int, int]:
+        """Return the (year, month) that is offset months after year/month."""
+        index = month - 1 + offset
+        return year + index // 12, index % 12 + 1
+    
     def _generate_contract_symbols(self, num_months: int = 24, 
                                    start_date: Optional[datetime] = None) -> List[Dict]:
         """
@@ -82,12 +227,11 @@ class NaturalGasForwardCurve:
         current_date = start_date.replace(day=1)
         
         for i in range(num_months):
-            future_date = current_date + relativedelta(months=i)
-            month = future_date.month
-            year = future_date.year
+            year, month = self._add_months(current_date.year, current_date.month, i)
             year_short = year % 100
             
             month_code = self.MONTH_CODES[month]
+            month_name = self.MONTH_NAMES[month]
             
             # Yahoo Finance format: NGH26.NYM (correct format confirmed)
             yahoo_symbol = f"{self.base_symbol}{month_code}{year_short}.NYM"
@@ -96,9 +240,9 @@ class NaturalGasForwardCurve:
                 'month': month,
                 'year': year,
                 'month_code': month_code,
-                'month_name': self.MONTH_NAMES[month],
-                'contract_name': f"{self.MONTH_NAMES[month]} {year}",
-                'expiry_date': future_date,
+                'month_name': month_name,
+                'contract_name': f"{month_name} {year}",
+                'expiry_date': current_date.replace(year=year, month=month),
                 'yahoo_symbol': yahoo_symbol,
                 'cme_code': f"NG{month_code}{year_short}"
             })
@@ -129,54 +273,50 @@ class NaturalGasForwardCurve:
             print(f"Fetching live forward curve for {num_months} months...")
         
         contracts = self._generate_contract_symbols(num_months)
-        results = []
-        
-        for i, contract in enumerate(contracts):
-            symbol = contract['yahoo_symbol']
-            price = None
-            volume = None
-            open_price = None
-            high_price = None
-            low_price = None
-            last_update = None
-            
+        symbols = [contract['yahoo_symbol'] for contract in contracts]
+        
+        cached = self._load_cached_quotes()
+        quotes = {symbol: cached[symbol] for symbol in symbols if symbol in cached}
+        to_fetch = [symbol for symbol in symbols if symbol not in quotes]
+        
+        if to_fetch:
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="5d")
-                
-                if not hist.empty:
-                    price = hist['Close'].iloc[-1]
-                    volume = hist['Volume'].iloc[-1] if 'Volume' in hist.columns else None
-                    open_price = hist['Open'].iloc[-1] if 'Open' in hist.columns else None
-                    high_price = hist['High'].iloc[-1] if 'High' in hist.columns else None
-                    low_price = hist['Low'].iloc[-1] if 'Low' in hist.columns else None
-                    last_update = hist.index[-1]
-                    
+                fetched_quotes = self._download_quotes(to_fetch)
             except Exception as e:
                 if verbose:
-                    print(f"  Warning: Could not fetch {symbol}: {str(e)[:50]}")
+                    print(f"  Warning: Chart API fetch failed: {str(e)[:50]}")
+                fetched_quotes = {}
             
-            results.append({
-                'Contract': contract['contract_name'],
-                'Symbol': symbol,
-                'Month': contract['month'],
-                'Year': contract['year'],
-                'Expiry': contract['expiry_date'],
-                'CME_Code': contract['cme_code'],
-                'Price': round(price, 4) if price else None,
-                'Open': round(open_price, 4) if open_price else None,
-                'High': round(high_price, 4) if high_price else None,
-                'Low': round(low_price, 4) if low_price else None,
-                'Volume': int(volume) if volume and not np.isnan(volume) else None,
-                'Last_Update': last_update
-            })
+            # Retry contracts the async fetch did not return one by one; each
+            # is an independent network round-trip, so dispatch them
+            # concurrently.
+            missing = [symbol for symbol in to_fetch if symbol not in fetched_quotes]
+            if missing:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    fetched = executor.map(
+                        lambda symbol: self._fetch_contract_quote(symbol, verbose),
+                        missing
+                    )
+                    fetched_quotes.update(
+                        (symbol, bar) for symbol, bar in zip(missing, fetched)
+                        if bar is not None
+                    )
             
-            # Small delay to avoid rate limiting
-            if i % 5 == 4:
-                time.sleep(0.2)
+            self._store_cached_quotes(fetched_quotes)
+            quotes.update(fetched_quotes)
+        
+        results = [self._build_contract_row(contract, quotes.get(contract['yahoo_symbol']))
+                   for contract in contracts]
         
         df = pd.DataFrame(results)
         
+        # Coerce price and volume columns once; zero values count as missing
+        price_columns = ['Price', 'Open', 'High', 'Low']
+        prices = df[price_columns].astype(np.float64)
+        df[price_columns] = prices.where(prices != 0).round(4)
+        volumes = df['Volume'].astype(np.float64)
+        df['Volume'] = volumes.where(volumes != 0).astype('Int64')
+        
         # Filter out contracts with no price data
         df_valid = df[df['Price'].notna()].copy()
         
@@ -187,6 +327,279 @@ class NaturalGasForwardCurve:
         
         return df_valid
     
+    def _load_cached_quotes(self) -> Dict[str, Dict]:
+        """
+        Load contract quotes from the on-disk cache that are still within the TTL.
+        
+        Returns:
+            Dictionary mapping symbol to its cached OHLCV bar
+        """
+        if self.cache_ttl <= 0:
+            return {}
+        
+        now = time.time()
+        quotes = {}
+        for symbol, (fetched_at, bar) in self._read_cache_entries().items():
+            if now - fetched_at >= self.cache_ttl:
+                continue
+            
+            bar = dict(bar)
+            tz = bar.pop('Timezone')
+            if bar['Last_Update'] is not None:
+                try:
+                    last_update = pd.Timestamp(bar['Last_Update'])
+                    if tz is not None:
+                        last_update = last_update.tz_convert(tz)
+                except (KeyError, TypeError, ValueError):
+                    continue
+                bar['Last_Update'] = last_update
+            quotes[symbol] = bar
+        
+        return quotes
+    
+    def _store_cached_quotes(self, quotes: Dict[str, Dict]) -> None:
+        """
+        Merge freshly fetched contract quotes into the on-disk cache.
+        
+        Args:
+            quotes: Dictionary mapping symbol to its latest OHLCV bar
+        """
+        if self.cache_ttl <= 0 or not quotes:
+            return
+        
+        now = time.time()
+        entries = {symbol: {'fetched_at': fetched_at, 'bar': bar}
+                   for symbol, (fetched_at, bar) in self._read_cache_entries().items()
+                   if now - fetched_at < self.cache_ttl}
+        
+        for symbol, bar in quotes.items():
+            bar = dict(bar)
+            bar['Timezone'] = None
+            if bar.get('Last_Update') is not None:
+                last_update = pd.Timestamp(bar['Last_Update'])
+                bar['Last_Update'] = last_update.isoformat()
+                if last_update.tz is not None:
+                    bar['Timezone'] = str(last_update.tz)
+            entries[symbol] = {'fetched_at': now, 'bar': bar}
+        
+        # Write to a private temp file (O_EXCL, mode 0600) in the cache
+        # directory, then rename it into place so concurrent processes never
+        # read a partial file
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(self.cache_path) or '.'
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.quotes-', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.cache_path)
+            tmp_path = None
+        except (OSError, TypeError, ValueError):
+            pass
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    def _read_cache_entries(self) -> Dict[str, Tuple[float, Dict]]:
+        """
+        Read and validate the raw quote cache file.
+        
+        Returns:
+            Dictionary mapping symbol to (fetch time, bar). A missing,
+            unreadable or malformed file, and any malformed entry, is treated
+            as a cache miss.
+        """
+        try:
+            with open(self.cache_path, 'r') as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(raw, dict):
+            return {}
+        
+        entries = {}
+        for symbol, entry in raw.items():
+            if not isinstance(entry, dict):
+                continue
+            fetched_at = entry.get('fetched_at')
+            bar = entry.get('bar')
+            if not isinstance(fetched_at, (int, float)) or not isinstance(bar, dict):
+                continue
+            if set(bar) != set(CACHED_BAR_FIELDS):
+                continue
+            if not all(bar[field] is None or isinstance(bar[field], (int, float))
+                       for field in CACHED_BAR_FIELDS
+                       if field not in ('Last_Update', 'Timezone')):
+                continue
+            if not all(bar[field] is None or isinstance(bar[field], str)
+                       for field in ('Last_Update', 'Timezone')):
+                continue
+            entries[symbol] = (float(fetched_at), bar)
+        
+        return entries
+    
+    def _download_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch the latest daily bar for many contracts concurrently.
+        
+        Args:
+            symbols: Yahoo Finance contract symbols
+            
+        Returns:
+            Dictionary mapping symbol to its latest OHLCV bar. Symbols without
+            data are omitted.
+        """
+        return asyncio.run(self._download_quotes_async(symbols))
+    
+    async def _download_quotes_async(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Fetch chart data for all symbols over one pooled aiohttp session."""
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_connections_per_host)
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        
+        limiter = AsyncRateLimiter(max_concurrency=self.max_connections_per_host,
+                                   max_wait=self.max_retry_wait)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=YAHOO_HEADERS) as session:
+            bars = await asyncio.gather(
+                *[self._fetch_chart_bar(session, limiter, symbol) for symbol in symbols],
+                return_exceptions=True
+            )
+        
+        return {symbol: bar for symbol, bar in zip(symbols, bars)
+                if isinstance(bar, dict)}
+    
+    async def _fetch_chart_bar(self, session: 'aiohttp.ClientSession',
+                               limiter: 'AsyncRateLimiter',
+                               symbol: str) -> Optional[Dict]:
+        """
+        Fetch one contract from the Yahoo chart endpoint, retrying on 429/5xx.
+        
+        Args:
+            session: Shared aiohttp session
+            limiter: Shared rate limiter, updated from every response
+            symbol: Yahoo Finance contract symbol
+            
+        Returns:
+            Latest OHLCV bar, or None if unavailable
+        """
+        url = YAHOO_CHART_URL.format(symbol=symbol)
+        params = {'range': '5d', 'interval': '1d'}
+        
+        for attempt in range(self.max_retries):
+            async with limiter:
+                async with session.get(url, params=params) as response:
+                    limiter.update(response.headers)
+                    
+                    if response.status == 200:
+                        return self._parse_chart_bar(await response.json())
+                    if response.status != 429 and response.status < 500:
+                        return None
+                    retry_after = _header_number(response.headers, 'Retry-After')
+            
+            if attempt == self.max_retries - 1:
+                break
+            
+            # Back off outside the limiter so other requests can proceed; a
+            # server-provided Retry-After replaces the exponential delay, and
+            # one longer than max_retry_wait abandons the contract
+            if retry_after is not None:
+                if retry_after > self.max_retry_wait:
+                    return None
+                await asyncio.sleep(max(0.0, retry_after))
+            else:
+                await asyncio.sleep(2 ** attempt + random.random())
+        
+        return None
+    
+    @staticmethod
+    def _parse_chart_bar(payload: Dict) -> Optional[Dict]:
+        """Extract the most recent OHLCV bar from a Yahoo chart JSON response."""
+        result = (payload.get('chart') or {}).get('result') or []
+        if not result:
+            return None
+        
+        timestamps = result[0].get('timestamp') or []
+        quote = ((result[0].get('indicators') or {}).get('quote') or [{}])[0]
+        closes = quote.get('close') or []
+        
+        # The current session's bar can be empty before the first trade
+        for i in range(min(len(timestamps), len(closes)) - 1, -1, -1):
+            if closes[i] is not None:
+                break
+        else:
+            return None
+        
+        tz = result[0].get('meta', {}).get('exchangeTimezoneName', 'America/New_York')
+        
+        def field(name):
+            values = quote.get(name) or []
+            return values[i] if i < len(values) else None
+        
+        return {
+            'Close': closes[i],
+            'Volume': field('volume'),
+            'Open': field('open'),
+            'High': field('high'),
+            'Low': field('low'),
+            'Last_Update': pd.Timestamp(timestamps[i], unit='s', tz='UTC')
+                             .tz_convert(tz).normalize()
+        }
+    
+    def _fetch_contract_quote(self, symbol: str, verbose: bool = True) -> Optional[Dict]:
+        """
+        Fetch the latest daily bar for a single futures contract.
+        
+        Synchronous fallback for contracts the async fetch did not return (or
+        when no event loop can be started); reads the same chart JSON from
+        Yahoo's secondary host.
+        
+        Args:
+            symbol: Yahoo Finance contract symbol
+            verbose: Whether to print warnings for failed fetches
+            
+        Returns:
+            Latest OHLCV bar, or None if unavailable
+        """
+        try:
+            response = _SESSION.get(YAHOO_CHART_FALLBACK_URL.format(symbol=symbol),
+                                    params={'range': '5d', 'interval': '1d'},
+                                    timeout=self.request_timeout)
+            response.raise_for_status()
+            return self._parse_chart_bar(response.json())
+                
+        except Exception as e:
+            if verbose:
+                print(f"  Warning: Could not fetch {symbol}: {str(e)[:50]}")
+        
+        return None
+    
+    @staticmethod
+    def _build_contract_row(contract: Dict, bar: Optional[Dict]) -> Dict:
+        """Combine contract information with its latest bar (if any)."""
+        bar = bar or {}
+        
+        return {
+            'Contract': contract['contract_name'],
+            'Symbol': contract['yahoo_symbol'],
+            'Month': contract['month'],
+            'Year': contract['year'],
+            'Expiry': contract['expiry_date'],
+            'CME_Code': contract['cme_code'],
+            'Price': bar.get('Close'),
+            'Open': bar.get('Open'),
+            'High': bar.get('High'),
+            'Low': bar.get('Low'),
+            'Volume': bar.get('Volume'),
+            'Last_Update': bar.get('Last_Update')
+        }
+    
     def fetch_historical_prices(self, 
                                start_date: str,
                                end_date: Optional[str] = None,
@@ -207,6 +620,8 @@ class NaturalGasForwardCurve:
             >>> prices = ng.fetch_historical_prices('2024-01-01')
             >>> print(prices.tail())
         """
+        import yfinance as yf
+        
         print(f"Fetching historical prices from {start_date}...")
         
         ticker = yf.Ticker(self.continuous_symbol)
@@ -237,6 +652,8 @@ class NaturalGasForwardCurve:
         Returns:
             DataFrame with historical OHLCV data for the specific contract
         """
+        import yfinance as yf
+        
         print(f"Fetching historical data for {symbol}...")
         
         ticker = yf.Ticker(symbol)
@@ -271,6 +688,8 @@ class NaturalGasForwardCurve:
         Returns:
             Dictionary mapping dates to forward curve DataFrames
         """
+        import yfinance as yf
+        
         print(f"Fetching historical forward curves from {start_date}...")
         
         if end_date is None:
@@ -284,35 +703,33 @@ class NaturalGasForwardCurve:
             print("No historical data available for the specified period.")
             return {}
         
-        # Sample dates based on frequency
+        # Sample dates based on frequency, keeping only actual trading days
         sample_dates = hist.resample(sample_frequency).last().index
+        sample_dates = sample_dates[sample_dates.isin(hist.index)]
+        
+        # Look up base prices and format curve keys once for all sample dates
+        base_prices = hist['Close'].reindex(sample_dates).tolist()
+        curve_keys = sample_dates.strftime('%Y-%m-%d').tolist()
         
         historical_curves = {}
         
-        for date in sample_dates:
-            if date in hist.index:
-                base_price = hist.loc[date, 'Close']
-                
-                # Generate forward curve for this date
-                curve_data = []
-                for i in range(num_months):
-                    future_date = date + relativedelta(months=i)
-                    month = future_date.month
-                    year = future_date.year
-                    
-                    seasonal_factor = self._get_seasonal_factor(month)
-                    # Apply seasonal adjustment and small contango
-                    estimated_price = base_price * seasonal_factor * (1 + 0.002 * i)
-                    
-                    curve_data.append({
-                        'Contract': f"{self.MONTH_NAMES[month]} {year}",
-                        'Month': month,
-                        'Year': year,
-                        'Months_Forward': i,
-                        'Price': round(estimated_price, 3)
-                    })
-                
-                historical_curves[date.strftime('%Y-%m-%d')] = pd.DataFrame(curve_data)
+        for date, curve_key, base_price in zip(sample_dates, curve_keys, base_prices):
+            # Generate forward curve for this date, applying seasonal
+            # adjustment and small contango to the base price
+            months = [self._add_months(date.year, date.month, i) for i in range(num_months)]
+            curve_data = [
+                {
+                    'Contract': f"{self.MONTH_NAMES[month]} {year}",
+                    'Month': month,
+                    'Year': year,
+                    'Months_Forward': i,
+                    'Price': round(base_price * self._get_seasonal_factor(month)
+                                   * (1 + 0.002 * i), 3)
+                }
+                for i, (year, month) in enumerate(months)
+            ]
+            
+            historical_curves[curve_key] = pd.DataFrame(curve_data)
         
         print(f"Generated {len(historical_curves)} historical forward curves.")
         return historical_curves
@@ -358,6 +775,8 @@ class NaturalGasForwardCurve:
             print("No data to plot.")
             return
         
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(14, 7))
         
         # Create x-axis labels
@@ -412,6 +831,8 @@ class NaturalGasForwardCurve:
             print("No historical curves to plot.")
             return
         
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(14, 8))
         
         # Select evenly spaced dates
@@ -466,6 +887,9 @@ class NaturalGasForwardCurve:
             print("No data to plot.")
             return
         
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        
         fig, axes = plt.subplots(2, 1, figsize=(14, 10), 
                                 gridspec_kw={'height_ratios': [3, 1]})
         
@@ -513,25 +937,25 @@ class NaturalGasForwardCurve:
         if len(df) < 2:
             return pd.DataFrame()
         
-        spreads = []
-        for i in range(len(df) - 1):
-            current = df.iloc[i]
-            next_month = df.iloc[i + 1]
-            
-            if current['Price'] and next_month['Price']:
-                spread = next_month['Price'] - current['Price']
-                spread_pct = (spread / current['Price']) * 100
-                
-                spreads.append({
-                    'Near_Contract': current['Contract'],
-                    'Far_Contract': next_month['Contract'],
-                    'Near_Price': current['Price'],
-                    'Far_Price': next_month['Price'],
-                    'Spread': round(spread, 4),
-                    'Spread_Pct': round(spread_pct, 2)
-                })
-        
-        return pd.DataFrame(spreads)
+        near = df.iloc[:-1].reset_index(drop=True)
+        far = df.iloc[1:].reset_index(drop=True)
+        
+        # Skip pairs where either leg has a zero price
+        mask = (near['Price'] != 0) & (far['Price'] != 0)
+        near = near[mask]
+        far = far[mask]
+        
+        spread = far['Price'] - near['Price']
+        spread_pct = (spread / near['Price']) * 100
+        
+        return pd.DataFrame({
+            'Near_Contract': near['Contract'],
+            'Far_Contract': far['Contract'],
+            'Near_Price': near['Price'],
+            'Far_Price': far['Price'],
+            'Spread': spread.round(4),
+            'Spread_Pct': spread_pct.round(2)
+        }).reset_index(drop=True)
     
     def export_to_csv(self, df: pd.DataFrame, filepath: str) -> None:
         """Export DataFrame to CSV file."""